@@ -1,8 +1,20 @@
+import asyncio
+import io
 import logging
 import json
+import mmap
+import os
+import queue
+import sys
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Tuple, Dict, TypedDict, Any
+from typing import List, Tuple, Dict, Iterator, Optional, Any
 import tkinter as tk
 from tkinter import ttk, messagebox
 from tkinterdnd2 import DND_FILES  # type: ignore
@@ -10,16 +22,148 @@ from tkinterdnd2 import DND_FILES  # type: ignore
 from tooltip import ToolTip
 from manage_filetypes import ManageFileTypesUI
 
+# Optional fast path for large clipboard payloads; falls back to Tk below.
+try:
+    import pyperclip  # type: ignore
+except ImportError:
+    pyperclip = None
+
+# Optional filesystem watching for cache invalidation; without it the
+# mtime in the cache key still catches changes on the next copy.
+try:
+    from watchdog.observers import Observer  # type: ignore
+    from watchdog.events import FileSystemEventHandler  # type: ignore
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
 logger = logging.getLogger(__name__)
 
-class FileItem(TypedDict):
+
+class _CacheInvalidator(FileSystemEventHandler):
+    """Drops cached formatted content when a watched file changes on disk."""
+
+    def __init__(self, app: 'FilesSummarizer'):
+        self.app = app
+
+    def on_modified(self, event):
+        self._invalidate(event.src_path)
+
+    def on_deleted(self, event):
+        self._invalidate(event.src_path)
+
+    def _invalidate(self, src_path: str):
+        # Observer callbacks run on the watchdog thread; hop to the Tk thread.
+        self.app.root.after(0, self.app._invalidate_cached_content, Path(src_path))
+
+@dataclass(slots=True)
+class FileItem:
+    """Per-row bookkeeping; slotted so 10k-file drops don't pay a dict
+    (and its hash table) per entry."""
     path: Path
     type: str
-    selected: tk.BooleanVar
+    selected: bool = False
+
+# Single-lookup dispatch table for extension classification; keys are the
+# bare extension as produced by name.rpartition('.').
+_EXT_TO_TYPE = {
+    'py': 'python',
+    'ts': 'typescript',
+    'tsx': 'typescriptx',
+    'css': 'css',
+    'lua': 'lua',
+}
+
+
+@lru_cache(maxsize=4096)
+def _classify_name(name_lower: str) -> Tuple[str, str]:
+    """Map an already-lowercased file name to (type key, display text).
+
+    Cached because the same names recur across add, format, and copy passes,
+    and most files in a tree share a handful of names/extensions anyway.
+    """
+    if name_lower == 'readme.md':
+        return 'readme', '.md'
+    head, sep, ext = name_lower.rpartition('.')
+    if head and sep:
+        return _EXT_TO_TYPE.get(ext, 'unknown'), f'.{ext}'
+    return 'unknown', 'Unknown'
+
+
+# Output templates precompiled per (xml, include_path) combination; the
+# branch and header assembly happen once at import instead of per file.
+_TEMPLATES = {
+    (True, True): ('<file_info>\n  <path>{path}</path>\n  <type>{type}</type>\n</file_info>\n'
+                   '<content>\n{content}\n</content>\n'),
+    (True, False): ('<file_info>\n  <type>{type}</type>\n</file_info>\n'
+                    '<content>\n{content}\n</content>\n'),
+    (False, True): '# {path}\n{content}\n',
+    (False, False): '{content}\n',
+}
+
+
+def _format_content(abs_path: str, content: str, file_type: str, xml: bool, include_path: bool) -> str:
+    """Format file content with header information (pure, process-safe)."""
+    return _TEMPLATES[(xml, include_path)].format(path=abs_path, type=file_type, content=content)
+
+
+def _read_and_format(abs_path: str, file_type: str, xml: bool, include_path: bool) -> Tuple[str, int]:
+    """Read and format one file; module-level so ProcessPoolExecutor can pickle it."""
+    content = Path(abs_path).read_bytes().decode('utf-8')
+    return _format_content(abs_path, content, file_type, xml, include_path), len(content)
+
+
+@dataclass
+class _Accum:
+    """Mutable accumulator for processed file content, grouped by category."""
+    py: List[str] = field(default_factory=list)
+    ts: List[str] = field(default_factory=list)
+    css: List[str] = field(default_factory=list)
+    lua: List[str] = field(default_factory=list)
+    readme: str = ''
+    count: int = 0
+    chars: int = 0
 
 class FilesSummarizer:
     """A GUI application to summarize and copy text from allowed file types."""
 
+    # Immutable skip sets shared by all walks; frozensets are allocated once
+    # and give the cheapest possible membership tests in the hot loops.
+    _SYSTEM_DIRS = frozenset({
+        'node_modules', '__pycache__', 'venv', 'env',
+        'build', 'dist', '.git', '.svn', '.hg'
+    })
+
+    # Upper bound on cached formatted files (see _fmt_cache)
+    _FMT_CACHE_MAX = 512
+
+    # Files inserted per scheduled Tk callback during a drop
+    _DROP_BATCH = 200
+
+    # Files at or above this size are decoded straight from a memory map
+    # (see _read_file); smaller files don't amortize the mapping cost.
+    _MMAP_THRESHOLD = 1 << 20
+
+    # Short display text for the "type" column; rows carry the type as a
+    # shared tag reference instead of a per-row emoji string.
+    _TYPE_LABELS = {
+        'folder': 'Folder',
+        'python': 'Python',
+        'typescript': 'TypeScript',
+        'typescriptx': 'TSX',
+        'css': 'CSS',
+        'lua': 'Lua',
+        'readme': 'README',
+        'unknown': 'Unknown',
+    }
+
+    # File types we never want to read
+    _BLACKLISTED_EXTS = frozenset({
+        '.png', '.jpg', '.jpeg', '.gif', '.bmp',
+        '.tif', '.tiff', '.pdf', '.doc', '.docx',
+        '.xls', '.xlsx', '.ppt', '.pptx',
+    })
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("Files Summarizer")
@@ -28,9 +172,32 @@ class FilesSummarizer:
         self.root.configure(bg="#ffffff")
 
         self.settings_file = Path.home() / '.filesummarizer_settings.json'
-        
+        # Debounce state for save_settings: pending after() id plus the last
+        # dict actually written, so unchanged toggles never hit the disk.
+        self._save_after_id: Optional[str] = None
+        self._last_saved: Dict[str, Any] = {}
+
+        # Timestamp of the last posted progress update (see _maybe_update_progress)
+        self._last_progress_ts = 0.0
+        # Worker threads push progress/status updates here instead of
+        # scheduling one Tk callback each; _drain_ui_queue applies them in
+        # bulk and keeps only the newest progress value.
+        self._ui_queue: 'queue.Queue[tuple]' = queue.Queue()
+        # Status-bar writes are coalesced: update_status records the newest
+        # message and one after_idle flush applies it (see _flush_status).
+        self._pending_status = ""
+        self._last_status: Optional[str] = None
+        self._status_flush_scheduled = False
+
         self.file_items: Dict[str, FileItem] = {}
-        self.path_to_id: Dict[Path, str] = {}
+        # Folder nodes live here, keyed by tree item id, so copy passes
+        # iterate only real files and never stat a directory.
+        self.folder_items: Dict[str, Path] = {}
+        # Maps the string form of each path to its tree item id
+        self.path_to_id: Dict[str, str] = {}
+        # Files whose Treeview rows are deferred until their (collapsed)
+        # folder node is expanded; keyed by the folder's tree item id.
+        self._pending_children: Dict[str, List[Path]] = {}
         
         self.xml_format_enabled = tk.BooleanVar(value=True)
         self.filepath_enabled = tk.BooleanVar(value=True)
@@ -38,18 +205,23 @@ class FilesSummarizer:
         # Default file types (allowed)
         self.default_file_types = {'.py', '.ts', '.tsx', '.css', '.lua', 'readme.md'}
         self.allowed_file_types = set(self.default_file_types)
+        # Immutable snapshot of allowed_file_types for the per-file hot
+        # path; rebuilt whenever the mutable set changes (see save_settings).
+        self._allowed_snapshot = frozenset(self.allowed_file_types)
 
-        # a blacklist set of file types we never want to read
-        self.blacklisted_file_types = {
-            '.png', '.jpg', '.jpeg', '.gif', '.bmp',
-            '.tif', '.tiff', '.pdf', '.doc', '.docx', 
-            '.xls', '.xlsx', '.ppt', '.pptx',
-            # add more types as needed
-        }
-
-        # Cache for user decisions about unknown extensions to avoid repeated prompts
+        # Cache for user decisions about unknown extensions to avoid repeated
+        # prompts; persisted in the settings file so the answers survive
+        # restarts instead of re-prompting every session.
         self.extension_decisions: Dict[str, bool] = {}
 
+        # User-extendable blacklist, seeded from the class default and
+        # persisted alongside the other settings.
+        self.blacklisted_file_types = set(self._BLACKLISTED_EXTS)
+
+        # LRU of formatted file content keyed by (path, mtime_ns, xml, filepath),
+        # so repeated copies with unchanged files skip both read and format.
+        self._fmt_cache: OrderedDict[tuple, Tuple[str, int]] = OrderedDict()
+
         self.symbols = {
             'folder': "📁",
             'python': "🐍",
@@ -64,12 +236,55 @@ class FilesSummarizer:
             'error': "❌",
         }
         
+        # Watch directories of added files (when watchdog is installed) so
+        # edited files drop out of _fmt_cache without waiting for a re-stat.
+        self._watched_dirs: set = set()
+        self._observer = Observer() if Observer is not None else None
+        if self._observer is not None:
+            self._cache_invalidator = _CacheInvalidator(self)
+            self._observer.daemon = True
+            self._observer.start()
+
+        # One shared worker pool plus an asyncio loop ticked cooperatively
+        # from Tk, instead of spawning a daemon thread per drop/copy.
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='filesummarizer')
+        self.loop = asyncio.new_event_loop()
+
         self.load_settings()
         self.create_widgets()
         self.setup_drag_and_drop()
-        
+
+        self.root.after(20, self._tick_loop)
+        self.root.after(50, self._drain_ui_queue)
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+    def _tick_loop(self):
+        """Run one iteration of the asyncio loop from the Tk event loop."""
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        self.root.after(20, self._tick_loop)
+
+    def _drain_ui_queue(self):
+        """Apply queued worker UI updates on the Tk thread.
+
+        Drains everything available in one pass: status messages are applied
+        in order, while intermediate progress values are coalesced so only
+        the newest one touches the widget.
+        """
+        progress: Optional[float] = None
+        try:
+            while True:
+                kind, *args = self._ui_queue.get_nowait()
+                if kind == 'progress':
+                    progress = args[0]
+                elif kind == 'status':
+                    self.update_status(*args)
+        except queue.Empty:
+            pass
+        if progress is not None:
+            self._set_progress(progress)
+        self.root.after(50, self._drain_ui_queue)
+
     def load_settings(self):
         '''Load settings from a JSON file.'''
         try:
@@ -83,46 +298,99 @@ class FilesSummarizer:
                     for ext in saved_extensions:
                         self.allowed_file_types.add(ext)
 
+                    self.extension_decisions.update(settings.get('extension_decisions', {}))
+                    self.blacklisted_file_types.update(settings.get('blacklisted_file_types', []))
+
                     logger.info("Settings loaded successfully")
+            # Freeze the lookup sets once loading is done; the blacklist only
+            # changes via settings, the allowed snapshot also on user accepts.
+            self.blacklisted_file_types = frozenset(self.blacklisted_file_types)
+            self._allowed_snapshot = frozenset(self.allowed_file_types)
+            self._last_saved = self._current_settings()
         except Exception as e:
             logger.error(f"Error loading settings: {e}")
 
+    def _current_settings(self) -> Dict[str, Any]:
+        '''Build the settings dict in its on-disk shape.'''
+        return {
+            'xml_format': self.xml_format_enabled.get(),
+            'filepath': self.filepath_enabled.get(),
+            'allowed_file_types': sorted(self.allowed_file_types),
+            'extension_decisions': dict(self.extension_decisions),
+            'blacklisted_file_types': sorted(self.blacklisted_file_types),
+        }
+
     def save_settings(self):
-        '''Save settings to a JSON file.'''
+        '''Schedule a debounced write of the settings JSON file.'''
+        # Every path that mutates allowed_file_types ends up here, so this
+        # is the one place the hot-path snapshot needs refreshing.
+        self._allowed_snapshot = frozenset(self.allowed_file_types)
+        if self._current_settings() == self._last_saved:
+            return
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(500, self._do_save)
+
+    def _do_save(self):
+        '''Write settings to the JSON file if they changed since the last write.
+
+        Serializes once and writes with a single os.write to a temp file,
+        then os.replace, so the settings file is updated atomically.
+        '''
+        self._save_after_id = None
+        settings = self._current_settings()
+        if settings == self._last_saved:
+            return
         try:
-            settings = {
-                'xml_format': self.xml_format_enabled.get(),
-                'filepath': self.filepath_enabled.get(),
-                'allowed_file_types': list(self.allowed_file_types),
-            }
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f)
+            data = json.dumps(settings).encode('utf-8')
+            tmp = self.settings_file.with_suffix('.tmp')
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            os.replace(tmp, self.settings_file)
+            self._last_saved = settings
             logger.info("Settings saved successfully")
         except Exception as e:
             logger.error(f"Error saving settings: {e}")
 
     def on_closing(self):
-        self.save_settings()
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        self._do_save()
+        if self._observer is not None:
+            self._observer.stop()
+        for task in asyncio.all_tasks(self.loop):
+            task.cancel()
+        self._pool.shutdown(wait=False)
+        self.loop.close()
         self.root.destroy()
 
     def create_widgets(self):
         '''Create all widgets for the application.'''
-        style = ttk.Style(self.root)
-        style.theme_use('clam')
-    
-        style.configure("Treeview.Heading",
-                        font=("Segoe UI", 10, "bold"),
-                        padding=5)
-        style.configure("Treeview",
-                        font=("Segoe UI", 10),
-                        rowheight=25)
-        
-        style.configure("TButton", font=("Segoe UI", 10), padding=6)
-        style.configure("TLabel", font=("Segoe UI", 11))
-        style.configure("Header.TLabel", font=("Segoe UI", 16, "bold"), background="#ffffff")
-        style.configure("Status.TLabel", font=("Segoe UI", 10), background="#d9d9d9")
-        style.configure("TCheckbutton", font=("Segoe UI", 10))
-        style.configure("Hovered.TButton", background='#e0e0e0')
+        # Styles live in the Tk interpreter, not the widget tree, so
+        # configure them once per root rather than per instantiation.
+        if not getattr(self.root, '_styles_configured', False):
+            style = ttk.Style(self.root)
+            style.theme_use('clam')
+
+            style.configure("Treeview.Heading",
+                            font=("Segoe UI", 10, "bold"),
+                            padding=5)
+            style.configure("Treeview",
+                            font=("Segoe UI", 10),
+                            rowheight=25)
+
+            style.configure("TButton", font=("Segoe UI", 10), padding=6)
+            style.configure("TLabel", font=("Segoe UI", 11))
+            style.configure("Header.TLabel", font=("Segoe UI", 16, "bold"), background="#ffffff")
+            style.configure("Status.TLabel", font=("Segoe UI", 10), background="#d9d9d9")
+            style.configure("TCheckbutton", font=("Segoe UI", 10))
+            # Let ttk handle hover natively; no per-event Python callbacks needed
+            style.map("TButton", background=[('active', '#e0e0e0')])
+            self.root._styles_configured = True
 
         # Header
         header = ttk.Label(self.root, text="Files Summarizer", style="Header.TLabel")
@@ -155,6 +423,27 @@ class FilesSummarizer:
         self.tree.heading("type", text="Type", anchor="center")
         self.tree.heading("path", text="Path", anchor="w")
         
+        # One-shot Tcl proc returning every descendant of a node, so subtree
+        # gathering costs one Tcl round-trip instead of one per node.
+        self.root.tk.eval(
+            'proc ::allkids {w n} { set r {}; foreach c [$w children $n] '
+            '{ lappend r $c; foreach d [::allkids $w $c] {lappend r $d} }; return $r }'
+        )
+
+        # One shared tag per file type: rows reference the tag instead of
+        # each storing its own symbol string, and styling lives in one place.
+        for type_key, color in (
+            ('folder', '#8a6d1f'),
+            ('python', '#2b6cb0'),
+            ('typescript', '#2c7a7b'),
+            ('typescriptx', '#2f855a'),
+            ('css', '#b7791f'),
+            ('lua', '#553c9a'),
+            ('readme', '#718096'),
+            ('unknown', '#a0aec0'),
+        ):
+            self.tree.tag_configure(type_key, foreground=color)
+
         vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.tree.xview)
         self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
@@ -182,7 +471,6 @@ class FilesSummarizer:
         )
         self.copy_button.pack(side=tk.LEFT, padx=5)
         ToolTip(self.copy_button, "Copy all files in the list to clipboard (Ctrl+C)")
-        self.add_hover_effect(self.copy_button)
 
         # Remove Button
         self.remove_button = ttk.Button(
@@ -192,7 +480,6 @@ class FilesSummarizer:
         )
         self.remove_button.pack(side=tk.LEFT, padx=5)
         ToolTip(self.remove_button, "Remove highlighted items from the list (Del)")
-        self.add_hover_effect(self.remove_button)
 
         # Clear Button
         self.clear_button = ttk.Button(
@@ -202,7 +489,6 @@ class FilesSummarizer:
         )
         self.clear_button.pack(side=tk.LEFT, padx=5)
         ToolTip(self.clear_button, "Clear all items from the list (Ctrl+X)")
-        self.add_hover_effect(self.clear_button)
 
         # XML Format Toggle
         self.xml_toggle_button = ttk.Checkbutton(
@@ -252,6 +538,7 @@ class FilesSummarizer:
         
         self.tree.bind('<Delete>', self.handle_delete_key)
         self.tree.bind('<Button-3>', self.show_context_menu)
+        self.tree.bind('<<TreeviewOpen>>', self.on_folder_open)
 
     def handle_delete_key(self, event=None):
         """Handle delete key press from the TreeView."""
@@ -288,26 +575,23 @@ class FilesSummarizer:
 
             parent_id = self.tree.parent(item_id)
             items_to_remove = [item_id]
-            items_to_remove.extend(self.get_all_children(item_id))  # Recursively gather subfolders/files
+            items_to_remove.extend(self.get_all_children(item_id))  # Gather subfolders/files
 
             for child_id in items_to_remove:
-                # Remove from file_items if present
+                # Remove from file_items/folder_items if present
                 if child_id in self.file_items:
-                    path = self.file_items[child_id]['path']
+                    path = self.file_items[child_id].path
                     del self.file_items[child_id]
-                    if path in self.path_to_id:
-                        del self.path_to_id[path]
-                else:
-                    values = self.tree.item(child_id, 'values')
-                    if values:
-                        folder_path_str = values[-1]
-                        folder_path = Path(folder_path_str)
-                        if folder_path in self.path_to_id:
-                            del self.path_to_id[folder_path]
+                    self.path_to_id.pop(str(path), None)
+                    self._invalidate_cached_content(path)
+                elif child_id in self.folder_items:
+                    self.path_to_id.pop(str(self.folder_items.pop(child_id)), None)
+                # Deferred children never got rows; drop their registrations too
+                for pending_path in self._pending_children.pop(child_id, ()):
+                    self.path_to_id.pop(str(pending_path), None)
 
-                # Remove from the TreeView
-                if self.tree.exists(child_id):
-                    self.tree.delete(child_id)
+            # Delete the whole subtree in one Tcl round-trip
+            self.tree.delete(item_id)
 
             # Remove any empty parents up the chain
             self.cleanup_empty_parents(parent_id)
@@ -327,19 +611,10 @@ class FilesSummarizer:
                 if not self.tree.exists(parent_id):
                     break  # Already gone
 
-                if not self.tree.get_children(parent_id):
-                    # Remove from self.file_items/path_to_id
-                    if parent_id in self.file_items:
-                        path = self.file_items[parent_id]['path']
-                        del self.file_items[parent_id]
-                        if path in self.path_to_id:
-                            del self.path_to_id[path]
-                    else:
-                        values = self.tree.item(parent_id, 'values')
-                        if values:
-                            folder_path = Path(values[-1])
-                            if folder_path in self.path_to_id:
-                                del self.path_to_id[folder_path]
+                if not self.tree.get_children(parent_id) and parent_id not in self._pending_children:
+                    # Remove from folder_items/path_to_id
+                    if parent_id in self.folder_items:
+                        self.path_to_id.pop(str(self.folder_items.pop(parent_id)), None)
 
                     grandparent_id = self.tree.parent(parent_id)
                     self.tree.delete(parent_id)
@@ -354,27 +629,19 @@ class FilesSummarizer:
 
     def get_all_children(self, item_id: str) -> List[str]:
         """
-        Recursively retrieve all child item IDs from the TreeView,
-        so that removing a parent folder also removes everything below it.
+        Retrieve all descendant item IDs from the TreeView via the ::allkids
+        Tcl proc — one Tcl round-trip for the whole subtree — so that
+        removing a parent folder also removes everything below it.
         """
-        descendants = []
         try:
-            for child in self.tree.get_children(item_id):
-                descendants.append(child)
-                descendants.extend(self.get_all_children(child))
+            return list(self.root.tk.splitlist(
+                self.root.tk.call('::allkids', str(self.tree), item_id)
+            ))
         except Exception as e:
             logger.error(f"Error getting children of item {item_id}: {e}")
-        return descendants
+            return []
 
     
-    def add_hover_effect(self, widget: ttk.Button):
-        def on_enter(e):
-            widget['style'] = 'Hovered.TButton'
-        def on_leave(e):
-            widget['style'] = 'TButton'
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
-
     def setup_drag_and_drop(self):
         self.root.drop_target_register(DND_FILES)
         self.root.dnd_bind('<<Drop>>', self.handle_drop)
@@ -384,33 +651,30 @@ class FilesSummarizer:
         logger.debug(f"Drop event triggered with data: {event.data}")
         paths = self.root.tk.splitlist(event.data)
         
-        unique_paths = {Path(path.strip('"')) for path in paths}
-        existing_paths = {path for path in unique_paths if path in self.path_to_id}
-        new_paths = unique_paths - existing_paths
+        # Dedup on normalized strings before constructing Path objects, so
+        # duplicate drops don't each pay Path allocation.
+        unique_strs = {os.path.normpath(path.strip('"')) for path in paths}
+        new_paths = {Path(s) for s in unique_strs if s not in self.path_to_id}
         
         if not new_paths:
             self.update_status("No new files were added.", 'warning')
             return "break"
         
-        total_files = 0
-        for path in new_paths:
-            if path.is_dir():
-                total_files += sum(1 for _ in self.get_valid_files(path))
-            else:
-                total_files += 1
-        
-        self.progress['maximum'] = 100
-        self.progress['value'] = 0
-        
-        threading.Thread(
-            target=self._process_dropped_items,
-            args=(new_paths, total_files),
-            daemon=True
-        ).start()
-        
+        # Enumeration length is unknown until the walk completes; spin an
+        # indeterminate bar instead of paying a second full directory walk
+        # just to pre-count files.
+        self.progress.configure(mode='indeterminate')
+        self.progress.start(10)
+
+        self.loop.create_task(self._adrop(new_paths))
+
         return "break"
 
-    def _process_dropped_items(self, paths: set[Path], total_files: int):
+    async def _adrop(self, paths: set[Path]):
+        """Run the drop processing on the shared worker pool."""
+        await self.loop.run_in_executor(self._pool, self._process_dropped_items, paths)
+
+    def _process_dropped_items(self, paths: set[Path]):
         """Process dropped items in a separate thread."""
         try:
             files_to_add = []
@@ -421,80 +685,115 @@ class FilesSummarizer:
                     files_to_add.append(path)
 
             sorted_files = sorted(files_to_add, key=lambda p: str(p).lower())
+            total_files = len(sorted_files)
+
+            # The walk is done, so the total is now known; flip the bar to
+            # determinate for the insertion phase.
+            self.root.after(0, self._begin_determinate_progress)
 
-            for idx, file_path in enumerate(sorted_files, 1):
-                self.root.after(0, self.add_path_to_tree, file_path)
-                progress_percent = (idx / total_files) * 100 if total_files > 0 else 100
-                self.progress['value'] = progress_percent
-                self.root.update_idletasks()
+            # Post insertions in batches: one scheduled callback and one
+            # layout pass per batch instead of per file.
+            for start in range(0, total_files, self._DROP_BATCH):
+                self.root.after(0, self._add_batch, sorted_files[start:start + self._DROP_BATCH])
+                done = min(start + self._DROP_BATCH, total_files)
+                self._maybe_update_progress((done / total_files) * 100, force=done == total_files)
 
             status_message = f"Added {len(sorted_files)} file{'s' if len(sorted_files) != 1 else ''}"
-            self.root.after(0, self.update_status, status_message, 'info')
+            self._ui_queue.put(('status', status_message, 'info'))
             logger.info(f"Successfully processed drop event: {status_message}")
 
         except Exception as e:
             error_msg = f"Error processing dropped items: {str(e)}"
             self.root.after(0, self.show_error, error_msg)
-            self.root.after(0, self.update_status, error_msg, 'error')
+            self._ui_queue.put(('status', error_msg, 'error'))
             logger.error(error_msg, exc_info=True)
         finally:
-            self.root.after(0, lambda: setattr(self.progress, 'value', 100))
+            self.root.after(0, self._finish_progress)
+
+    def _begin_determinate_progress(self):
+        """Switch the progress bar from the enumeration spinner to determinate."""
+        self.progress.stop()
+        self.progress.configure(mode='determinate', maximum=100, value=0)
+
+    def _set_progress(self, pct: float):
+        """Set the progress bar value. GUI thread only."""
+        self.progress.configure(value=pct)
+
+    def _maybe_update_progress(self, pct: float, force: bool = False):
+        """Post a progress update at most ~30 times a second. Worker-safe."""
+        now = time.monotonic()
+        if force or now - self._last_progress_ts > 0.033:
+            self._last_progress_ts = now
+            self._ui_queue.put(('progress', pct))
+
+    def _finish_progress(self):
+        """Stop any spinner and park the progress bar at complete."""
+        self.progress.stop()
+        self.progress.configure(mode='determinate', value=100)
+
+    def _add_batch(self, paths: List[Path]) -> None:
+        """Insert a batch of discovered files into the tree in one callback."""
+        for path in paths:
+            self.add_path_to_tree(path)
 
     def add_path_to_tree(self, path: Path) -> None:
         """
         Add a path to the tree view, creating parent folders as needed.
-        Every folder node is also stored in file_items and path_to_id,
+        Every folder node is also stored in folder_items and path_to_id,
         so that removing an upstream folder will remove everything below it.
+
+        Walks plain strings joined incrementally: no intermediate Path
+        objects are built per component, and path_to_id is keyed on the
+        string form.
         """
         try:
-            if path in self.path_to_id:
+            path_str = str(path)
+            if path_str in self.path_to_id:
                 return  # Already in the tree
 
+            # Fast path: batches arrive sorted, so the parent folder is
+            # almost always already present — insert the leaf straight under
+            # it instead of re-probing every ancestor from the root.
+            parent_id = self.path_to_id.get(os.path.dirname(path_str))
+            if parent_id and self.tree.exists(parent_id):
+                if not self.tree.item(parent_id, 'open'):
+                    # Folder is collapsed: defer the row until it is expanded
+                    # so huge drops only pay Tk insertion for visible items.
+                    self._pending_children.setdefault(parent_id, []).append(path)
+                    # Map to the folder id so duplicate drops still dedup;
+                    # on_folder_open rebinds this to the real row id.
+                    self.path_to_id[path_str] = parent_id
+                    return
+                self._insert_file_node(parent_id, path, path_str)
+                return
+
             current_parent = ""
-            current_path = Path()
+            current_str = ""
 
             for part in path.parts:
-                current_path = current_path / part
-                existing_id = self.path_to_id.get(current_path)
+                current_str = os.path.join(current_str, part) if current_str else part
+                existing_id = self.path_to_id.get(current_str)
 
                 if existing_id and self.tree.exists(existing_id):
                     # Reuse existing node
                     current_parent = existing_id
                 else:
-                    is_final = (current_path == path)
+                    is_final = (current_str == path_str)
                     if is_final:
                         # It's the actual file
-                        symbol = self.determine_file_type(current_path)
-                        file_type = self.get_file_type_text(current_path)
-                        new_id = self.tree.insert(
-                            current_parent,
-                            "end",
-                            text=part,
-                            values=(symbol, str(current_path))
-                        )
-                        self.path_to_id[current_path] = new_id
-                        self.file_items[new_id] = {
-                            "path": current_path,
-                            "type": file_type,
-                            "selected": tk.BooleanVar(value=False),
-                        }
+                        new_id = self._insert_file_node(current_parent, path, path_str)
                     else:
                         # It's an intermediate folder
                         new_id = self.tree.insert(
                             current_parent,
                             "end",
                             text=part,
-                            values=(self.symbols["folder"], str(current_path)),
-                            open=True
+                            values=(self._TYPE_LABELS['folder'], current_str),
+                            tags=('folder',),
+                            open=False
                         )
-                        self.path_to_id[current_path] = new_id
-
-                        # Also store the folder node in file_items
-                        self.file_items[new_id] = {
-                            "path": current_path,
-                            "type": "Folder",
-                            "selected": tk.BooleanVar(value=False),
-                        }
+                        self.path_to_id[current_str] = new_id
+                        self.folder_items[new_id] = Path(current_str)
 
                     current_parent = new_id
 
@@ -502,50 +801,78 @@ class FilesSummarizer:
             logger.error(f"Error adding path to tree: {path} - {str(e)}")
             self.update_status(f"Error adding: {path.name}", "error")
 
+    def _insert_file_node(self, parent_id: str, path: Path, path_str: str) -> str:
+        """Insert a single file row under parent_id and register it."""
+        type_key, type_text = _classify_name(path.name.lower())
+        new_id = self.tree.insert(
+            parent_id,
+            "end",
+            text=path.name,
+            values=(self._TYPE_LABELS[type_key], path_str),
+            tags=(type_key,)
+        )
+        self.path_to_id[path_str] = new_id
+        self.file_items[new_id] = FileItem(path=path, type=type_text)
+        self._watch_dir(path.parent)
+        return new_id
+
+    def on_folder_open(self, event=None):
+        """Materialize deferred child rows when their folder is expanded."""
+        folder_id = self.tree.focus()
+        pending = self._pending_children.pop(folder_id, None)
+        if not pending:
+            return
+        for path in pending:
+            self._insert_file_node(folder_id, path, str(path))
+
     def update_item_selection(self, item_id: str) -> None:
         """Update the selection state of an item and its children."""
-        selected = self.file_items[item_id]['selected'].get()
+        selected = self.file_items[item_id].selected
         for child_id in self.tree.get_children(item_id):
             if child_id in self.file_items:
-                self.file_items[child_id]['selected'].set(selected)
+                self.file_items[child_id].selected = selected
 
-    def get_valid_files(self, directory: Path) -> List[Path]:
-        """Get all valid files from a directory recursively."""
-        valid_files = []
-        try:
-            for item in directory.rglob('*'):
-                if self._should_skip_path(item):
-                    continue
-                if item.is_file() and self._is_valid_file(item):
-                    valid_files.append(item)
-        except PermissionError:
-            logger.warning(f"Permission denied accessing {directory}")
-        except Exception as e:
-            logger.error(f"Error accessing {directory}: {e}")
-        return valid_files
+    def get_valid_files(self, directory: Path) -> Iterator[Path]:
+        """Yield all valid files from a directory recursively.
 
-    def _should_skip_path(self, path: Path) -> bool:
-        """Check if a path should be skipped entirely."""
-        if path.name.startswith('.'):
-            return True
-        
-        system_dirs = {
-            'node_modules', '__pycache__', 'venv', 'env',
-            'build', 'dist', '.git', '.svn', '.hg'
-        }
-        
-        current = path
-        while current != current.parent:
-            if current.name in system_dirs:
-                return True
-            current = current.parent
-        
-        return False
+        Uses an explicit stack over os.scandir so each entry costs a single
+        syscall (is_dir/is_file reuse the dirent) and skipped subtrees are
+        pruned at descent time instead of being walked and filtered.
+        """
+        # Known-allowed suffixes for a C-level endswith check; files that
+        # match are accepted before any Path construction. Everything else
+        # still goes through _is_valid_file (blacklist + user prompt).
+        fast_suffixes = tuple(ext for ext in self._allowed_snapshot if ext.startswith('.'))
+
+        stack = [str(directory)]
+        while stack:
+            top = stack.pop()
+            try:
+                with os.scandir(top) as entries:
+                    for entry in entries:
+                        if entry.name.startswith('.') or entry.name in self._SYSTEM_DIRS:
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            name_lower = entry.name.lower()
+                            if name_lower.endswith(fast_suffixes) or name_lower == 'readme.md':
+                                yield Path(entry.path)
+                            else:
+                                path = Path(entry.path)
+                                if self._is_valid_file(path):
+                                    yield path
+            except PermissionError:
+                logger.warning(f"Permission denied accessing {top}")
+            except Exception as e:
+                logger.error(f"Error accessing {top}: {e}")
 
     def _is_valid_file(self, file_path: Path) -> bool:
         """Check if a file is valid for processing or blacklisted. 
            Only ask the user once per unique unknown extension."""
-        ext_lower = file_path.suffix.lower()
+        # Interned so repeated lookups reuse one string object and its
+        # cached hash across all three set probes.
+        ext_lower = sys.intern(file_path.suffix.lower())
         name_lower = file_path.name.lower()
 
         # Skip blacklisted
@@ -557,7 +884,7 @@ class FilesSummarizer:
             return True
 
         # If extension is already allowed, proceed
-        if ext_lower in self.allowed_file_types:
+        if ext_lower in self._allowed_snapshot:
             return True
 
         # If we've already asked the user about this extension in the current session
@@ -566,41 +893,42 @@ class FilesSummarizer:
             return self.extension_decisions[ext_lower]
 
         # Otherwise, ask the user if they want to allow this extension in the future
-        answer = messagebox.askyesno(
-            "Unknown File Type",
-            f"Do you want to allow *{ext_lower}* files?\n\nFile: {file_path}"
-        )
-        # Cache the user's decision to avoid repeated prompts for this extension
+        answer = self._ask_extension_allowed(ext_lower, file_path)
+        # Cache the user's decision (persisted) to avoid repeated prompts
         self.extension_decisions[ext_lower] = answer
 
         if answer:
-            # User said yes -> add to allowed_file_types and save to settings
+            # User said yes -> add to allowed_file_types as well
             self.allowed_file_types.add(ext_lower)
-            self.save_settings()
-            return True
-        else:
-            # User said no -> skip files of this extension
-            return False
+        self.root.after(0, self.save_settings)
+        return answer
+
+    def _ask_extension_allowed(self, ext_lower: str, file_path: Path) -> bool:
+        """Prompt about an unknown extension; safe to call from a worker.
+
+        messagebox must run on the Tk thread, so from a worker the prompt is
+        scheduled via after() and the worker blocks on an Event until the
+        user answers.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return messagebox.askyesno(
+                "Unknown File Type",
+                f"Do you want to allow *{ext_lower}* files?\n\nFile: {file_path}"
+            )
+        answered = threading.Event()
+        result: Dict[str, bool] = {}
+
+        def ask():
+            result['answer'] = messagebox.askyesno(
+                "Unknown File Type",
+                f"Do you want to allow *{ext_lower}* files?\n\nFile: {file_path}"
+            )
+            answered.set()
+
+        self.root.after(0, ask)
+        answered.wait()
+        return result.get('answer', False)
 
-    def determine_file_type(self, file_path: Path) -> str:
-        """Return an icon or symbol for the file type in the TreeView."""
-        if file_path.is_dir():
-            return self.symbols['folder']
-        elif file_path.name.lower() == "readme.md":
-            return self.symbols['readme']
-        elif file_path.suffix.lower() == ".py":
-            return self.symbols['python']
-        elif file_path.suffix.lower() == ".ts":
-            return self.symbols['typescript']
-        elif file_path.suffix.lower() == ".tsx":
-            return self.symbols['typescriptx']
-        elif file_path.suffix.lower() == ".css":
-            return self.symbols['css']
-        elif file_path.suffix.lower() == ".lua":
-            return self.symbols['lua']
-        else:
-            return self.symbols['unknown']
-        
     def copy_to_clipboard(self):
         """Copy all files in the list to clipboard."""
         if not self.file_items:
@@ -609,7 +937,11 @@ class FilesSummarizer:
             logger.error("No files or folders in the list.")
             return
 
-        all_paths = [item_data['path'] for item_data in self.file_items.values()]
+        all_paths = [item_data.path for item_data in self.file_items.values()]
+        # Files deferred behind collapsed folders have no rows yet but still
+        # belong to the copy.
+        for pending in self._pending_children.values():
+            all_paths.extend(pending)
         if not all_paths:
             self.show_error("No files in the list to copy.")
             self.update_status("No items available to copy.", 'error')
@@ -622,11 +954,11 @@ class FilesSummarizer:
         self.update_status("Processing files...", 'info')
         logger.info(f"Starting processing of {len(all_paths)} items.")
 
-        threading.Thread(
-            target=self._process_and_copy,
-            args=(all_paths,),
-            daemon=True
-        ).start()
+        self.loop.create_task(self._acopy(all_paths))
+
+    async def _acopy(self, paths: List[Path]):
+        """Run the copy processing on the shared worker pool."""
+        await self.loop.run_in_executor(self._pool, self._process_and_copy, paths)
 
     def _process_and_copy(self, selected_paths: List[Path]):
         """Process files and copy to clipboard."""
@@ -636,110 +968,254 @@ class FilesSummarizer:
         except Exception as e:
             logger.exception("An unexpected error occurred during file processing.")
             self.root.after(0, self.show_error, "An unexpected error occurred during processing.")
-            self.root.after(0, self.update_status, "Error during processing.", 'error')
+            self._ui_queue.put(('status', 'Error during processing.', 'error'))
             self.root.after(0, self.toggle_buttons, 'normal')
             return
 
-        combined_content = "\n\n".join(filter(None, [
-            "\n\n".join(py_content),
-            "\n\n".join(ts_content),
-            "\n\n".join(css_content),
-            "\n\n".join(lua_content),
-            readme_content
-        ]))
+        # Keep the per-file chunks as a list in category order; the total
+        # length is known without ever joining them into one string.
+        chunks = [
+            chunk
+            for chunk in chain(py_content, ts_content, css_content, lua_content, (readme_content,))
+            if chunk
+        ]
 
-        if combined_content:
+        if chunks:
             try:
-                self.root.clipboard_clear()
-                self.root.clipboard_append(combined_content)
+                total_len = sum(map(len, chunks)) + 2 * (len(chunks) - 1)
+                if pyperclip is not None and total_len > 262144:
+                    # Multi-MB payloads through Tcl pay a large Unicode
+                    # conversion cost; hand those to the OS clipboard directly.
+                    # pyperclip needs a single string, so join only here.
+                    buf = io.StringIO()
+                    for chunk in chunks:
+                        if buf.tell():
+                            buf.write("\n\n")
+                        buf.write(chunk)
+                    pyperclip.copy(buf.getvalue())
+                else:
+                    # Append chunk by chunk on the GUI thread; Tk accumulates
+                    # the clipboard internally so no joined copy is built here.
+                    self.root.after(0, self._push_clipboard, chunks)
                 status_msg = f"Copied content from {file_count} files, totaling {total_characters} characters."
                 logger.info(status_msg)
-                self.root.after(0, self.update_status, status_msg, 'info')
+                self._ui_queue.put(('status', status_msg, 'info'))
             except Exception as e:
                 logger.exception("Failed to copy content to clipboard.")
                 self.root.after(0, self.show_error, f"Failed to copy to clipboard: {e}")
-                self.root.after(0, self.update_status, "Failed to copy to clipboard.", 'error')
+                self._ui_queue.put(('status', 'Failed to copy to clipboard.', 'error'))
         else:
             self.root.after(0, self.show_warning, "No eligible files found, or all files were unreadable.")
-            self.root.after(0, self.update_status, "No content was copied to clipboard.", 'warning')
+            self._ui_queue.put(('status', 'No content was copied to clipboard.', 'warning'))
             logger.warning("No eligible content to copy.")
 
         self.root.after(0, lambda: setattr(self.progress, 'value', 100))
         self.root.after(0, self.toggle_buttons, 'normal')
 
+    def _push_clipboard(self, chunks: List[str]):
+        """Append chunks to the Tk clipboard one by one. GUI thread only."""
+        try:
+            self.root.clipboard_clear()
+            first = True
+            for chunk in chunks:
+                if not first:
+                    self.root.clipboard_append("\n\n")
+                self.root.clipboard_append(chunk)
+                first = False
+        except Exception as e:
+            logger.exception("Failed to copy content to clipboard.")
+            self.show_error(f"Failed to copy to clipboard: {e}")
+            self.update_status("Failed to copy to clipboard.", 'error')
+
+    def _read_file(self, path: Path) -> str:
+        """Read a file's text content. Pure helper with no UI side-effects.
+
+        Reads into a bytearray pre-sized from fstat and decodes once:
+        no TextIOWrapper chunking, no newline translation, and no
+        grow-and-copy reallocations. Files past _MMAP_THRESHOLD are
+        decoded straight from a memory map instead, skipping even the
+        kernel-to-bytearray copy.
+        """
+        with open(path, 'rb', buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= self._MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        return str(view, 'utf-8')
+                    finally:
+                        view.release()
+            buf = bytearray(size)
+            view = memoryview(buf)
+            got = 0
+            while got < size:
+                n = f.readinto(view[got:])
+                if not n:
+                    break
+                got += n
+            view.release()
+            if got < size:
+                # File shrank between stat and read
+                del buf[got:]
+        return buf.decode('utf-8')
+
     def process_files(self, file_paths: List[Path]) -> Tuple[List[str], List[str], List[str], List[str], str, int, int]:
         """
-        Read each file from file_paths (skipping directories),
-        build content lists, and return combined info.
+        Read each file from file_paths (skipping directories) using a thread
+        pool so disk reads overlap, build content lists, and return combined info.
         """
-        py_contents = []
-        ts_contents = []
-        css_contents = []
-        lua_contents = []
-        readme_content = ""
-        file_count = 0
-        total_characters = 0
-
-        for idx, path in enumerate(file_paths, start=1):
-            # Skip directories to avoid "Permission denied" or "No such file" errors
-            if path.is_dir():
-                logger.debug(f"Skipping directory: {path}")
-                continue
-
-            self.progress['value'] = (idx - 1) / len(file_paths) * 100
-            self.root.update_idletasks()
-
+        acc = _Accum()
+
+        # file_items only ever holds real files (folders live in
+        # folder_items), so no per-path is_dir() stat is needed here.
+        actual_files = file_paths
+
+        if not actual_files:
+            return acc.py, acc.ts, acc.css, acc.lua, acc.readme, acc.count, acc.chars
+
+        # Check the formatted-content LRU first; unchanged files with the
+        # same format flags skip both the read and the format below.
+        xml = self.xml_format_enabled.get()
+        fp = self.filepath_enabled.get()
+        # Resolve absolute path strings once per batch; Path.absolute() would
+        # re-run getcwd + normalization per file inside the loop.
+        cwd = os.getcwd()
+        abs_strs: Dict[Path, str] = {}
+        type_texts: Dict[Path, str] = {}
+        cache_keys: Dict[Path, Optional[tuple]] = {}
+        cached: Dict[Path, Tuple[str, int]] = {}
+        to_read: List[Path] = []
+        for path in actual_files:
+            fspath = os.fspath(path)
+            abs_strs[path] = fspath if os.path.isabs(fspath) else os.path.join(cwd, fspath)
+            type_texts[path] = self.get_file_type_text(path)
             try:
-                with path.open("r", encoding="utf-8") as f:
-                    content = f.read()
-
-                content_with_header = self.format_content(path, content, self.get_file_type_text(path))
-                
-                # Route by extension for grouping
-                ext_lower = path.suffix.lower()
-                name_lower = path.name.lower()
-
-                if name_lower == "readme.md":
-                    readme_content = content_with_header
-                elif ext_lower == ".py":
-                    py_contents.append(content_with_header)
-                elif ext_lower in (".ts", ".tsx"):
-                    ts_contents.append(content_with_header)
-                elif ext_lower == ".css":
-                    css_contents.append(content_with_header)
-                elif ext_lower == ".lua":
-                    lua_contents.append(content_with_header)
-                else:
-                    # For any other extension (like .txt),
-                    # we just append to py_contents for now
-                    py_contents.append(content_with_header)
-
-                file_count += 1
-                total_characters += len(content)
-                logger.debug(f"Processed file: {path}")
-                
-            except UnicodeDecodeError:
-                logger.warning(f"Unable to read {path} with UTF-8 encoding. Skipping.")
-                self.root.after(0, self.show_error, f"Unable to read {path} (UTF-8). Skipping.")
-            except Exception as e:
-                logger.error(f"Error processing file {path}: {e}")
-                self.root.after(0, self.show_error, f"Error processing file {path}: {e}")
+                key = (path, path.stat().st_mtime_ns, xml, fp)
+            except OSError:
+                key = None
+            cache_keys[path] = key
+            entry = self._fmt_cache.get(key) if key is not None else None
+            if entry is not None:
+                self._fmt_cache.move_to_end(key)
+                cached[path] = entry
+            else:
+                to_read.append(path)
+
+        # Reads are pure I/O (the GIL is released during read()), so overlap
+        # them in a pool. Above ~200 files the formatting itself is enough
+        # CPU work to be worth fanning read+format out to processes.
+        contents: Dict[Path, str] = {}
+        formatted: Dict[Path, Tuple[str, int]] = {}
+        # Collect per-file read failures and report them in one dialog after
+        # the batch, instead of popping a modal for every bad file.
+        errors: List[str] = []
+        if len(to_read) > 200:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = {
+                    executor.submit(
+                        _read_and_format, abs_strs[path], type_texts[path], xml, fp
+                    ): path
+                    for path in to_read
+                }
+                for idx, future in enumerate(as_completed(futures), start=1):
+                    path = futures[future]
+                    self._maybe_update_progress(idx / len(to_read) * 100, force=idx == len(to_read))
+                    try:
+                        formatted[path] = future.result()
+                    except UnicodeDecodeError:
+                        logger.warning(f"Unable to read {path} with UTF-8 encoding. Skipping.")
+                        errors.append(f"{path}: not valid UTF-8")
+                    except Exception as e:
+                        logger.error(f"Error processing file {path}: {e}")
+                        errors.append(f"{path}: {e}")
+        elif to_read:
+            with ThreadPoolExecutor(max_workers=min(32, len(to_read))) as executor:
+                futures = {executor.submit(self._read_file, path): path for path in to_read}
+                for idx, future in enumerate(as_completed(futures), start=1):
+                    path = futures[future]
+                    self._maybe_update_progress(idx / len(to_read) * 100, force=idx == len(to_read))
+                    try:
+                        contents[path] = future.result()
+                    except UnicodeDecodeError:
+                        logger.warning(f"Unable to read {path} with UTF-8 encoding. Skipping.")
+                        errors.append(f"{path}: not valid UTF-8")
+                    except Exception as e:
+                        logger.error(f"Error processing file {path}: {e}")
+                        errors.append(f"{path}: {e}")
+
+        if errors:
+            shown = errors[:20]
+            if len(errors) > len(shown):
+                shown.append(f"... and {len(errors) - len(shown)} more (see log)")
+            summary = f"Skipped {len(errors)} unreadable file{'s' if len(errors) != 1 else ''}:\n\n" + "\n".join(shown)
+            self.root.after(0, self.show_warning, summary)
+
+        # Route results back into buckets in the original (sorted) order so
+        # output stays deterministic regardless of read completion order.
+        for path in actual_files:
+            entry = cached.get(path)
+            if entry is None:
+                entry = formatted.get(path)
+                if entry is None:
+                    if path not in contents:
+                        continue
+                    content = contents[path]
+                    entry = (
+                        _format_content(abs_strs[path], content, type_texts[path], xml, fp),
+                        len(content)
+                    )
+                key = cache_keys[path]
+                if key is not None:
+                    self._fmt_cache[key] = entry
+                    if len(self._fmt_cache) > self._FMT_CACHE_MAX:
+                        self._fmt_cache.popitem(last=False)
+            self._accumulate(path, entry[0], entry[1], acc)
+
+        return acc.py, acc.ts, acc.css, acc.lua, acc.readme, acc.count, acc.chars
+
+    def _accumulate(self, path: Path, content_with_header: str, content_len: int, acc: _Accum) -> None:
+        """Append one file's formatted content to the right bucket of acc."""
+        # Route by type key for grouping; one lower() per file
+        type_key = _classify_name(path.name.lower())[0]
+
+        if type_key == 'readme':
+            acc.readme = content_with_header
+        elif type_key == 'python':
+            acc.py.append(content_with_header)
+        elif type_key in ('typescript', 'typescriptx'):
+            acc.ts.append(content_with_header)
+        elif type_key == 'css':
+            acc.css.append(content_with_header)
+        elif type_key == 'lua':
+            acc.lua.append(content_with_header)
+        else:
+            # For any other extension (like .txt),
+            # we just append to the python bucket for now
+            acc.py.append(content_with_header)
+
+        acc.count += 1
+        acc.chars += content_len
+        logger.debug(f"Processed file: {path}")
 
-        return py_contents, ts_contents, css_contents, lua_contents, readme_content, file_count, total_characters
+    def _watch_dir(self, directory: Path) -> None:
+        """Register a non-recursive watch the first time a directory is seen."""
+        if self._observer is None:
+            return
+        key = str(directory)
+        if key in self._watched_dirs:
+            return
+        try:
+            self._observer.schedule(self._cache_invalidator, key, recursive=False)
+            self._watched_dirs.add(key)
+        except OSError as e:
+            logger.warning(f"Could not watch {directory}: {e}")
 
+    def _invalidate_cached_content(self, path: Path) -> None:
+        """Drop any formatted-content cache entries for a removed path."""
+        stale = [key for key in self._fmt_cache if key[0] == path]
+        for key in stale:
+            del self._fmt_cache[key]
 
-    def format_content(self, file_path: Path, content: str, file_type: str) -> str:
-        """Format file content with header information."""
-        if self.xml_format_enabled.get():
-            header = f'<file_info>\n'
-            if self.filepath_enabled.get():
-                header += f'  <path>{file_path.absolute()}</path>\n'
-            header += f'  <type>{file_type}</type>\n'
-            header += f'</file_info>\n'
-            return f'{header}<content>\n{content}\n</content>\n'
-        else:
-            header = f'# {file_path.absolute()}\n' if self.filepath_enabled.get() else ''
-            return f'{header}{content}\n'
 
     def remove_selected(self):
         """Remove items highlighted in the TreeView."""
@@ -760,7 +1236,10 @@ class FilesSummarizer:
         if messagebox.askyesno("Confirm Clear", "Are you sure you want to remove all items?"):
             self.tree.delete(*self.tree.get_children())
             self.file_items.clear()
+            self.folder_items.clear()
             self.path_to_id.clear()
+            self._pending_children.clear()
+            self._fmt_cache.clear()
             self.update_status("All items cleared.", 'info')
             logger.info("All items cleared from the list.")
 
@@ -770,9 +1249,23 @@ class FilesSummarizer:
             button.config(state=state)
 
     def update_status(self, message: str, status_type: str = 'info'):
-        """Update the status bar with a message."""
+        """Update the status bar with a message.
+
+        Bursts of updates coalesce to one StringVar write (and thus one
+        label redraw) per idle cycle; only the newest message is shown.
+        """
         status_symbol = self.symbols.get(status_type, '')
-        self.status_var.set(f"{status_symbol} {message}")
+        self._pending_status = f"{status_symbol} {message}"
+        if not self._status_flush_scheduled:
+            self._status_flush_scheduled = True
+            self.root.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        """Apply the newest pending status message if it changed."""
+        self._status_flush_scheduled = False
+        if self._pending_status != self._last_status:
+            self._last_status = self._pending_status
+            self.status_var.set(self._pending_status)
 
     def show_info(self, message: str):
         """Show an info message."""
@@ -804,13 +1297,10 @@ class FilesSummarizer:
 
     def get_file_type_text(self, file_path: Path) -> str:
         """
-        Return the actual extension (e.g., ".txt", ".css", ".py") 
+        Return the actual extension (e.g., ".txt", ".css", ".py")
         or ".md" for readme.md, or "Unknown" if none.
         """
-        if file_path.name.lower() == "readme.md":
-            return ".md"
-        ext = file_path.suffix.lower()
-        return ext if ext else "Unknown"
+        return _classify_name(file_path.name.lower())[1]
 
     def manage_file_types(self):
         """Open a new window for managing allowed file types."""
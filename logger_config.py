@@ -1,21 +1,54 @@
 import logging
+import os
 from logging.handlers import RotatingFileHandler
 
+
+class CachedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler without the per-emit stat syscalls.
+
+    The stock shouldRollover re-checks that the log path is a regular file
+    on every record; cache that answer when the stream is (re)opened and
+    size the file through the already-open stream instead.
+    """
+
+    def _open(self):
+        stream = super()._open()
+        self._is_regular_file = os.path.isfile(self.baseFilename)
+        return stream
+
+    def shouldRollover(self, record):
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        if not getattr(self, '_is_regular_file', True):
+            return False
+        msg = f"{self.format(record)}\n"
+        self.stream.seek(0, 2)
+        return self.stream.tell() + len(msg) >= self.maxBytes
+
+
 # Configure logger
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
+# Records are fully handled here; don't bubble to the root logger
+logger.propagate = False
 
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+# Guard so a re-import (or a second module wiring up logging) can't stack
+# duplicate handlers, which would double formatter work and file writes
+# per record.
+if not logger.handlers:
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 
-# File handler with rotation
-file_handler = RotatingFileHandler("app.log", maxBytes=5 * 1024 * 1024, backupCount=2)
-file_handler.setFormatter(formatter)
-file_handler.setLevel(logging.DEBUG)
+    # File handler with rotation
+    file_handler = CachedRotatingFileHandler("app.log", maxBytes=5 * 1024 * 1024, backupCount=2)
+    file_handler.setFormatter(formatter)
+    file_handler.setLevel(logging.DEBUG)
 
-# Stream handler for console output
-stream_handler = logging.StreamHandler()
-stream_handler.setFormatter(formatter)
-stream_handler.setLevel(logging.INFO)
+    # Stream handler for console output
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    stream_handler.setLevel(logging.INFO)
 
-logger.addHandler(file_handler)
-logger.addHandler(stream_handler)
+    logger.addHandler(file_handler)
+    logger.addHandler(stream_handler)
@@ -40,8 +40,8 @@ class ManageFileTypesUI(tk.Toplevel):
         self.listbox = tk.Listbox(lb_frame, selectmode=tk.EXTENDED)
         self.listbox.pack(fill=tk.BOTH, expand=True)
 
-        for ext in sorted(self.allowed_file_types):
-            self.listbox.insert(tk.END, ext)
+        # One Tcl call for the whole list instead of one insert per entry
+        self.listbox.insert(tk.END, *sorted(self.allowed_file_types))
 
         self.listbox.bind('<Delete>', self.on_listbox_delete)
 
@@ -103,8 +103,7 @@ class ManageFileTypesUI(tk.Toplevel):
         self.allowed_file_types.clear()
         self.allowed_file_types.update(self.default_file_types)
         self.listbox.delete(0, tk.END)
-        for ext in sorted(self.allowed_file_types):
-            self.listbox.insert(tk.END, ext)
+        self.listbox.insert(tk.END, *sorted(self.allowed_file_types))
         self.save_settings_callback()
         logger.info("Reset file types to default.")
 
@@ -12,10 +12,10 @@ class ScrollableFrame(ttk.Frame):
         self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
         self.scrollable_frame = ttk.Frame(self.canvas, padding=(0, 0, 0, 0))
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        # Coalesce scrollregion recomputes: a burst of child layout changes
+        # schedules one bbox("all") per idle cycle instead of one per event.
+        self._sr_pending = False
+        self.scrollable_frame.bind("<Configure>", self._schedule_scrollregion)
 
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
@@ -26,33 +26,51 @@ class ScrollableFrame(ttk.Frame):
         # Bind mouse wheel events
         self.bind_mouse_wheel()
 
+    def _schedule_scrollregion(self, event=None):
+        if self._sr_pending:
+            return
+        self._sr_pending = True
+        self.after_idle(self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        self._sr_pending = False
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
     def bind_mouse_wheel(self):
+        # Attach wheel handlers only while the pointer is over the canvas:
+        # no global bind_all, so multiple scrollable panels can coexist and
+        # wheel events elsewhere never reach these handlers.
+        self.canvas.bind("<Enter>", self._activate_mouse_wheel)
+        self.canvas.bind("<Leave>", self._deactivate_mouse_wheel)
+
+    def _activate_mouse_wheel(self, event=None):
         operating_system = platform.system()
         if operating_system == 'Windows':
-            self.canvas.bind_all("<MouseWheel>", self.on_mousewheel_windows)
+            self.canvas.bind("<MouseWheel>", self.on_mousewheel_windows)
         elif operating_system == 'Darwin':  # macOS
-            self.canvas.bind_all("<MouseWheel>", self.on_mousewheel_mac)
+            self.canvas.bind("<MouseWheel>", self.on_mousewheel_mac)
         else:  # Linux and other systems
-            self.canvas.bind_all("<Button-4>", self.on_mousewheel_linux)
-            self.canvas.bind_all("<Button-5>", self.on_mousewheel_linux)
+            self.canvas.bind("<Button-4>", self.on_mousewheel_linux)
+            self.canvas.bind("<Button-5>", self.on_mousewheel_linux)
 
-    def unbind_mouse_wheel(self):
+    def _deactivate_mouse_wheel(self, event=None):
         operating_system = platform.system()
         if operating_system == 'Windows':
-            self.canvas.unbind_all("<MouseWheel>")
+            self.canvas.unbind("<MouseWheel>")
         elif operating_system == 'Darwin':  # macOS
-            self.canvas.unbind_all("<MouseWheel>")
+            self.canvas.unbind("<MouseWheel>")
         else:  # Linux and other systems
-            self.canvas.unbind_all("<Button-4>")
-            self.canvas.unbind_all("<Button-5>")
+            self.canvas.unbind("<Button-4>")
+            self.canvas.unbind("<Button-5>")
 
     def on_mousewheel_windows(self, event):
-        # For Windows, event.delta is a multiple of 120
-        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        # For Windows, event.delta is a multiple of 120, so integer
+        # division is exact — no float divide and cast per event
+        self.canvas.yview_scroll(-(event.delta // 120), "units")
 
     def on_mousewheel_mac(self, event):
         # For macOS, event.delta is typically smaller
-        self.canvas.yview_scroll(int(-1 * (event.delta)), "units")
+        self.canvas.yview_scroll(-event.delta, "units")
 
     def on_mousewheel_linux(self, event):
         # For Linux, use Button-4 (scroll up) and Button-5 (scroll down)
@@ -60,8 +78,3 @@ class ScrollableFrame(ttk.Frame):
             self.canvas.yview_scroll(-1, "units")
         elif event.num == 5:
             self.canvas.yview_scroll(1, "units")
-
-    def destroy(self):
-        # Ensure that mouse wheel bindings are removed when the frame is destroyed
-        self.unbind_mouse_wheel()
-        super().destroy()
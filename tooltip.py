@@ -3,13 +3,21 @@ from typing import Optional, Any
 
 
 class ToolTip:
-    """A tooltip that appears when hovering over a widget."""
+    """A tooltip that appears when hovering over a widget.
+
+    All instances share a single hidden tip window (only one tooltip can
+    be visible at a time), so the app allocates one Toplevel + Label total
+    and each hover costs a text/geometry update plus deiconify.
+    """
+
+    # Shared tip window, built lazily on first show
+    _tip_window: Optional[tk.Toplevel] = None
+    _tip_label: Optional[tk.Label] = None
 
     def __init__(self, widget: tk.Widget, text: str, delay: int = 500):
         self.widget = widget
         self.text = text
         self.delay = delay
-        self.tip_window: Optional[tk.Toplevel] = None
         self.id = ""
         self.widget.bind("<Enter>", self.schedule)
         self.widget.bind("<Leave>", self.unschedule)
@@ -24,26 +32,34 @@ class ToolTip:
             self.id = ""
         self.hide_tip()
 
-    def show_tip(self, event: Optional[Any] = None):
-        if self.tip_window or not self.text:
-            return
-        x = self.widget.winfo_rootx() + self.widget.winfo_width() // 2
-        y = self.widget.winfo_rooty() + self.widget.winfo_height()
-        self.tip_window = tk.Toplevel(self.widget)
-        self.tip_window.wm_overrideredirect(True)
-        self.tip_window.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(
-            self.tip_window,
-            text=self.text,
+    @classmethod
+    def _build_tip_window(cls, master: tk.Widget) -> None:
+        cls._tip_window = tk.Toplevel(master)
+        cls._tip_window.wm_overrideredirect(True)
+        cls._tip_window.wm_withdraw()
+        cls._tip_label = tk.Label(
+            cls._tip_window,
             justify=tk.LEFT,
             background="#FFFFE0",
             relief=tk.SOLID,
             borderwidth=1,
             font=("Segoe UI", 10)
         )
-        label.pack(ipadx=1)
+        cls._tip_label.pack(ipadx=1)
+
+    def show_tip(self, event: Optional[Any] = None):
+        if not self.text:
+            return
+        cls = type(self)
+        if cls._tip_window is None or not cls._tip_window.winfo_exists():
+            cls._build_tip_window(self.widget.winfo_toplevel())
+        x = self.widget.winfo_rootx() + self.widget.winfo_width() // 2
+        y = self.widget.winfo_rooty() + self.widget.winfo_height()
+        cls._tip_label.configure(text=self.text)
+        cls._tip_window.wm_geometry(f"+{x}+{y}")
+        cls._tip_window.wm_deiconify()
 
     def hide_tip(self):
-        if self.tip_window:
-            self.tip_window.destroy()
-            self.tip_window = None
+        cls = type(self)
+        if cls._tip_window is not None and cls._tip_window.winfo_exists():
+            cls._tip_window.wm_withdraw()